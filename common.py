@@ -8,9 +8,14 @@
 import logging
 import os
 import time
+import random
 import re
 import csv
 import json
+import threading
+import functools
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 import asyncio
@@ -47,6 +52,32 @@ CSV_FILE_PATH = "news_data.csv"
 gsheet_client = None
 gsheet_worksheet = None
 
+# 구글 시트 레코드 캐시 (TTL 초 단위)
+_CACHE_TTL = 30
+_CACHE = {"ts": 0.0, "index": None, "worksheet_id": None}
+_CACHE_LOCK = threading.Lock()
+_CACHE_REFRESHED = threading.Event()
+_CACHE_WAIT_TIMEOUT = 5
+
+# 구글 시트 API 호출 제한 (사용자당 100회/100초 한도보다 여유 있게)
+# 버킷은 프로세스마다 따로이므로 전체 60회/100초를 uvicorn 워커 수로 나눠 사용
+_SHEETS_WORKER_COUNT = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+_SHEETS_BUCKET_CAPACITY = max(1, 60 // _SHEETS_WORKER_COUNT)
+_SHEETS_BUCKET_REFILL_PER_SEC = _SHEETS_BUCKET_CAPACITY / 100
+_SHEETS_BUCKET = {"tokens": float(_SHEETS_BUCKET_CAPACITY), "ts": time.monotonic()}
+_SHEETS_BUCKET_LOCK = threading.Lock()
+_SHEETS_RETRY_STATUS = (429, 503)
+
+# 뉴스 조회에 필요한 컬럼 (실제 위치는 시트 헤더에서 찾아 범위로 변환)
+_NEWS_COLUMNS = ('timestamp', 'title', 'url', 'is_relevant', 'relevance_score', 'category')
+_news_column_ranges: Optional[list] = None
+
+# 구글 시트 호출 전용 스레드풀 + 동시 호출 제한 (앱 startup/shutdown마다 생성/종료)
+_SHEETS_EXECUTOR_WORKERS = 8
+_SHEETS_CONCURRENCY = 4
+_sheets_executor: Optional[ThreadPoolExecutor] = None
+_sheets_semaphore: Optional[asyncio.Semaphore] = None
+
 logger = logging.getLogger(__name__)
 
 # ================================================================================
@@ -555,7 +586,7 @@ def crawl_news_content(url: str) -> str:
 
 def init_google_sheets():
     """Initialize Google Sheets client"""
-    global gsheet_client, gsheet_worksheet
+    global gsheet_client, gsheet_worksheet, _news_column_ranges
     
     if not GSPREAD_AVAILABLE:
         logger.error("❌ gspread not installed")
@@ -631,6 +662,13 @@ def init_google_sheets():
             except:
                 pass
         
+        # 뉴스 조회용 컬럼 범위 계산 (실패하면 첫 조회 때 다시 시도)
+        try:
+            _init_news_column_ranges()
+        except Exception as ce:
+            _news_column_ranges = None
+            logger.warning(f"⚠️ 뉴스 컬럼 범위 계산 실패: {ce}")
+        
         logger.info(f"✅ Google Sheets 초기화 완료")
         return True
         
@@ -640,9 +678,7 @@ def init_google_sheets():
         return False
         
     except Exception as e:
-        import traceback
-        logger.error(f"❌ Google Sheets 초기화 실패: {type(e).__name__}: {str(e)}")
-        logger.error(f"\n전체 에러 스택:\n{traceback.format_exc()}")
+        logger.exception("❌ Google Sheets 초기화 실패: %s: %s", type(e).__name__, e)
         return False
 
 def get_recent_urls_from_gsheet(hours: int = 3) -> set:
@@ -698,12 +734,224 @@ def get_recent_urls_from_gsheet(hours: int = 3) -> set:
         logger.error(f"❌ 최근 URL 조회 실패: {e}")
         return set()
 
-def get_latest_news_from_gsheet(limit: int = 5):
+def _acquire_sheets_token():
+    """토큰 버킷에서 API 호출 1회분을 가져옴 (부족하면 채워질 때까지 대기)"""
+    while True:
+        with _SHEETS_BUCKET_LOCK:
+            now = time.monotonic()
+            _SHEETS_BUCKET["tokens"] = min(
+                _SHEETS_BUCKET_CAPACITY,
+                _SHEETS_BUCKET["tokens"] + (now - _SHEETS_BUCKET["ts"]) * _SHEETS_BUCKET_REFILL_PER_SEC
+            )
+            _SHEETS_BUCKET["ts"] = now
+            if _SHEETS_BUCKET["tokens"] >= 1:
+                _SHEETS_BUCKET["tokens"] -= 1
+                return
+            wait = (1 - _SHEETS_BUCKET["tokens"]) / _SHEETS_BUCKET_REFILL_PER_SEC
+        time.sleep(wait)
+
+def _call_sheets_with_retry(fn, *args, max_tries: int = 5, **kwargs):
+    """
+    구글 시트 API 호출 (자체 속도 제한 + 429/503 지수 백오프 재시도)
+    
+    Args:
+        fn: 호출할 gspread 메서드
+        max_tries: 최대 시도 횟수
+    
+    Returns:
+        fn의 반환값
+    """
+    for attempt in range(max_tries):
+        _acquire_sheets_token()
+        try:
+            return fn(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            status = getattr(getattr(e, 'response', None), 'status_code', None)
+            if status not in _SHEETS_RETRY_STATUS or attempt == max_tries - 1:
+                raise
+            delay = min(30, (2 ** attempt) + random.uniform(0, 1))
+            logger.warning(f"⚠️ Google Sheets API {status} - {delay:.1f}초 후 재시도 ({attempt + 1}/{max_tries})")
+            time.sleep(delay)
+
+def _column_letter(col: int) -> str:
+    """1부터 시작하는 열 번호를 A1 표기 열 문자로 변환 (1 → A, 27 → AA)"""
+    letters = ""
+    while col:
+        col, rem = divmod(col - 1, 26)
+        letters = chr(ord('A') + rem) + letters
+    return letters
+
+def _build_news_column_ranges(header: list) -> list:
+    """
+    헤더에서 뉴스 조회에 필요한 컬럼 위치를 찾아 batch_get 범위로 묶음
+    
+    연속된 컬럼은 하나의 범위로 합친다 (예: D:F)
+    
+    Returns:
+        [(A1 범위, 컬럼 수), ...]
+    """
+    positions = sorted(i + 1 for i, name in enumerate(header) if name in _NEWS_COLUMNS)
+    missing = set(_NEWS_COLUMNS) - set(header)
+    if missing:
+        logger.warning(f"⚠️ 구글 시트 헤더에 뉴스 컬럼 없음: {sorted(missing)}")
+    
+    ranges = []
+    start = prev = None
+    for col in positions + [None]:
+        if start is not None and col == prev + 1:
+            prev = col
+            continue
+        if start is not None:
+            ranges.append((f"{_column_letter(start)}:{_column_letter(prev)}", prev - start + 1))
+        start = prev = col
+    return ranges
+
+def _init_news_column_ranges():
+    """현재 워크시트 헤더(1행)로 뉴스 컬럼 범위를 다시 계산"""
+    global _news_column_ranges
+    
+    header = _call_sheets_with_retry(gsheet_worksheet.row_values, 1)
+    _news_column_ranges = _build_news_column_ranges(header)
+    logger.info(f"   ✅ 뉴스 컬럼 범위: {[cell_range for cell_range, _ in _news_column_ranges]}")
+
+def _fetch_news_values() -> list:
+    """
+    뉴스 조회에 필요한 컬럼만 batch_get으로 한 번에 가져와 행 단위로 합침
+    
+    description, keywords 등 응답에 쓰지 않는 컬럼은 내려받지 않는다.
+    컬럼 범위는 init_google_sheets()에서 헤더 기준으로 계산해 둔 것을 사용
+    
+    Returns:
+        get_all_values()와 같은 형태의 2차원 리스트 (첫 행은 헤더)
+    """
+    if _news_column_ranges is None:
+        _init_news_column_ranges()
+    column_ranges = _news_column_ranges
+    if not column_ranges:
+        return []
+    
+    value_ranges = _call_sheets_with_retry(
+        gsheet_worksheet.batch_get,
+        [cell_range for cell_range, _ in column_ranges]
+    )
+    
+    # 범위마다 뒤쪽 빈 행/빈 칸이 잘려 오므로 길이를 맞춰서 합침
+    row_count = max((len(values) for values in value_ranges), default=0)
+    rows = []
+    for i in range(row_count):
+        row = []
+        for values, (_, width) in zip(value_ranges, column_ranges):
+            cells = values[i] if i < len(values) else []
+            row.extend(cells)
+            row.extend([''] * (width - len(cells)))
+        rows.append(row)
+    return rows
+
+def _load_records(ignore_cache: bool = False) -> dict:
+    """
+    구글 시트 뉴스 인덱스 조회 (TTL 캐시)
+    
+    캐시 갱신 시 한 번만 최신순 정렬과 카테고리별 분류를 해두고,
+    요청마다 슬라이싱만 하도록 한다.
+    캐시는 워크시트 ID 기준이라 시트가 다시 연결되면 바로 무효화된다.
+    캐시가 만료된 경우 한 스레드만 시트를 다시 읽고 (single-flight),
+    동시에 들어온 나머지 요청은 기존 캐시를 바로 사용한다
+    (캐시가 아직 없을 때만 갱신이 끝날 때까지 대기)
+    
+    Args:
+        ignore_cache: True면 캐시를 무시하고 새로 조회
+    
+    Returns:
+        {"total": 전체 행 수, "latest": 최신순 뉴스, "by_category": 카테고리별 최신순 뉴스}
+    """
+    worksheet_id = getattr(gsheet_worksheet, 'id', None)
+    fresh = (
+        _CACHE["index"] is not None
+        and _CACHE["worksheet_id"] == worksheet_id
+        and time.monotonic() - _CACHE["ts"] < _CACHE_TTL
+    )
+    if fresh and not ignore_cache:
+        return _CACHE["index"]
+    
+    if _CACHE_LOCK.acquire(blocking=False):
+        try:
+            _CACHE_REFRESHED.clear()
+            index = _build_news_index(_fetch_news_values())
+            _CACHE["index"] = index
+            _CACHE["worksheet_id"] = worksheet_id
+            _CACHE["ts"] = time.monotonic()
+            return index
+        finally:
+            _CACHE_REFRESHED.set()
+            _CACHE_LOCK.release()
+    
+    # 다른 스레드가 갱신 중 → 같은 워크시트의 캐시가 있으면 기다리지 않고 그대로 사용
+    if _CACHE["index"] is not None and _CACHE["worksheet_id"] == worksheet_id:
+        return _CACHE["index"]
+    
+    # 캐시가 비어 있으면 갱신 완료를 기다린 뒤 사용
+    if not _CACHE_REFRESHED.wait(timeout=_CACHE_WAIT_TIMEOUT):
+        logger.warning("⚠️ 구글 시트 캐시 갱신 대기 시간 초과")
+    
+    if _CACHE["index"] is not None and _CACHE["worksheet_id"] == worksheet_id:
+        return _CACHE["index"]
+    return {"total": 0, "latest": [], "by_category": {}}
+
+def _category_key(category: str) -> str:
+    """카테고리 비교용 키 (앞뒤 공백 제거, 대소문자 무시)"""
+    return (category or "").strip().lower()
+
+def _row_to_record(header: list, row: list) -> dict:
+    """시트 행을 레코드 딕셔너리로 변환 (get_all_records와 동일한 형태)"""
+    record = dict(zip(header, row))
+    score = record.get('relevance_score')
+    if isinstance(score, str) and score.isdigit():
+        record['relevance_score'] = int(score)
+    return record
+
+def _build_news_index(values: list) -> dict:
+    """
+    시트 값(첫 행은 헤더)으로 뉴스 인덱스 생성
+    
+    - is_relevant=True인 행만 딕셔너리로 변환
+    - timestamp 기준 최신순 정렬
+    - 카테고리별로 미리 분류 (각 리스트도 최신순 유지)
+    """
+    header, rows = (values[0], values[1:]) if values else ([], [])
+    index = {"total": len(rows), "latest": [], "by_category": {}}
+    
+    if not rows:
+        return index
+    
+    idx = {name: i for i, name in enumerate(header)}
+    if 'is_relevant' not in idx or 'timestamp' not in idx:
+        logger.warning(f"⚠️ 구글 시트 헤더에 필수 컬럼 없음: {header}")
+        return index
+    relevant_idx = idx['is_relevant']
+    timestamp_idx = idx['timestamp']
+    
+    relevant_rows = [
+        row for row in rows
+        if row[relevant_idx] in ('TRUE', 'True')
+    ]
+    relevant_rows.sort(key=operator.itemgetter(timestamp_idx), reverse=True)
+    
+    latest = [_row_to_record(header, row) for row in relevant_rows]
+    by_category = {}
+    for record in latest:
+        by_category.setdefault(_category_key(record.get('category', '')), []).append(record)
+    
+    index["latest"] = latest
+    index["by_category"] = by_category
+    return index
+
+def get_latest_news_from_gsheet(limit: int = 5, ignore_cache: bool = False):
     """
     구글 시트에서 최신 뉴스 N개 조회
     
     Args:
         limit: 가져올 뉴스 개수 (기본 5개)
+        ignore_cache: True면 캐시를 무시하고 시트에서 새로 조회
     
     Returns:
         뉴스 리스트 (딕셔너리 형태)
@@ -715,35 +963,102 @@ def get_latest_news_from_gsheet(limit: int = 5):
         return []
     
     try:
-        # 전체 레코드 가져오기
-        all_records = gsheet_worksheet.get_all_records()
+        # 뉴스 인덱스 가져오기 (캐시 사용)
+        index = _load_records(ignore_cache=ignore_cache)
         
-        if not all_records:
+        if not index["total"]:
             logger.warning("⚠️ No records in Google Sheets")
             return []
         
-        # is_relevant=True인 뉴스만 필터링
-        relevant_news = [
-            record for record in all_records
-            if record.get('is_relevant', False) in [True, 'TRUE', 'True']
-        ]
-        
-        # timestamp 기준 최신순 정렬
-        relevant_news.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        latest_news = index["latest"][:limit]
         
-        # 상위 N개 추출
-        latest_news = relevant_news[:limit]
-        
-        logger.info(f"✅ 구글 시트 조회: {len(latest_news)}개 (전체 {len(all_records)}개 중)")
+        logger.info("✅ 구글 시트 조회: %d개 (전체 %d개 중)", len(latest_news), index['total'])
         
         return latest_news
         
     except Exception as e:
-        logger.error(f"❌ 최신 뉴스 조회 실패: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("❌ 최신 뉴스 조회 실패: %s", e)
         return []
 
+def get_records_by_category(category: str, limit: int = 3) -> Optional[list]:
+    """
+    구글 시트에서 특정 카테고리의 최신 뉴스 N개 조회
+    
+    Args:
+        category: 카테고리명 (앞뒤 공백/대소문자 무시)
+        limit: 가져올 뉴스 개수 (기본 3개)
+    
+    Returns:
+        뉴스 리스트 (딕셔너리 형태).
+        시트 미초기화/조회 실패/시트를 아직 못 읽은 경우 None
+        (빈 리스트는 시트를 읽었는데 해당 카테고리 뉴스가 없다는 뜻)
+    """
+    if not gsheet_worksheet:
+        logger.warning("⚠️ Google Sheets not initialized")
+        return None
+    
+    try:
+        index = _load_records()
+        if not index["total"]:
+            return None
+        return index["by_category"].get(_category_key(category), [])[:limit]
+        
+    except Exception as e:
+        logger.exception("❌ 카테고리 뉴스 조회 실패: %s", e)
+        return None
+
+def refresh_news_cache() -> bool:
+    """
+    구글 시트 뉴스 캐시 강제 갱신 (백그라운드 갱신용)
+    
+    Returns:
+        갱신 성공 여부
+    """
+    if not gsheet_worksheet:
+        return False
+    
+    try:
+        index = _load_records(ignore_cache=True)
+        logger.info(f"🔄 뉴스 캐시 갱신: {len(index['latest'])}개 (전체 {index['total']}개 중)")
+        return True
+    except Exception as e:
+        logger.exception("❌ 뉴스 캐시 갱신 실패: %s", e)
+        return False
+
+def start_sheets_executor():
+    """구글 시트 전용 스레드풀/세마포어 생성 (이벤트 루프 안에서 호출)"""
+    global _sheets_executor, _sheets_semaphore
+    
+    if _sheets_executor is None:
+        _sheets_executor = ThreadPoolExecutor(
+            max_workers=_SHEETS_EXECUTOR_WORKERS, thread_name_prefix="gsheet"
+        )
+    _sheets_semaphore = asyncio.Semaphore(_SHEETS_CONCURRENCY)
+
+async def run_sheets_call(fn, *args, **kwargs):
+    """
+    블로킹 구글 시트 함수를 전용 스레드풀에서 실행 (이벤트 루프 블로킹 방지)
+    
+    동시에 실행되는 시트 호출 수는 세마포어로 제한.
+    startup 전에 호출되면 스레드풀을 그때 생성
+    """
+    if _sheets_executor is None or _sheets_semaphore is None:
+        start_sheets_executor()
+    
+    executor, semaphore = _sheets_executor, _sheets_semaphore
+    async with semaphore:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
+
+def shutdown_sheets_executor():
+    """구글 시트 전용 스레드풀 종료 (다음 startup에서 다시 생성)"""
+    global _sheets_executor, _sheets_semaphore
+    
+    if _sheets_executor is not None:
+        _sheets_executor.shutdown(wait=False, cancel_futures=True)
+    _sheets_executor = None
+    _sheets_semaphore = None
+
 def init_csv_file():
     """Initialize CSV file with headers"""
     try:
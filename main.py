@@ -5,16 +5,35 @@
 - 디버깅 기능 추가
 """
 
+import asyncio
+import functools
 import logging
+import os
+import re
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Dict, Optional, Tuple
 
+import orjson
 from fastapi import FastAPI, Request
-from pydantic import BaseModel
+from fastapi.responses import Response
+from starlette.routing import Route
+
+# 키워드 매칭용 (없으면 정규식으로 대체)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # 현재 작동 중인 common.py에서 import
 from common import (
     get_latest_news_from_gsheet,
+    get_records_by_category,
+    refresh_news_cache,
+    run_sheets_call,
+    start_sheets_executor,
+    shutdown_sheets_executor,
     init_google_sheets,
     init_csv_file
 )
@@ -23,10 +42,34 @@ from common import (
 # 로깅 설정
 # ================================================================================
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+class CachedTimeFormatter(logging.Formatter):
+    """
+    asctime 문자열을 초 단위로 캐시하는 Formatter
+    
+    같은 초에 찍히는 로그는 strftime/localtime을 다시 호출하지 않고
+    밀리초 부분만 붙여서 기본 Formatter와 같은 형식으로 출력
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_time = (None, "")
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, cached_text = self._cached_time
+        if second != cached_second:
+            cached_text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._cached_time = (second, cached_text)
+        return self.default_msec_format % (cached_text, record.msecs)
+
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 )
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
 logger = logging.getLogger(__name__)
 
 app = FastAPI(
@@ -69,6 +112,18 @@ CATEGORY_MAP = {
     "세금법률": "세금·법률·규제",
 }
 
+# 긴 키워드 우선 ("정책제도"가 "정책"보다 먼저 매칭되도록)
+_CATEGORY_KEYS_SORTED = sorted(CATEGORY_MAP, key=len, reverse=True)
+
+# 카테고리 키워드 매처 (모듈 로드 시 한 번만 생성)
+if AHOCORASICK_AVAILABLE:
+    _CATEGORY_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _category in CATEGORY_MAP.items():
+        _CATEGORY_AUTOMATON.add_word(_keyword, (_keyword, _category))
+    _CATEGORY_AUTOMATON.make_automaton()
+else:
+    _CATEGORY_PATTERN = re.compile("|".join(map(re.escape, _CATEGORY_KEYS_SORTED)))
+
 CATEGORY_EMOJI = {
     "정책·제도": "📋",
     "시장 동향·시황": "📊",
@@ -79,45 +134,60 @@ CATEGORY_EMOJI = {
 }
 
 # ================================================================================
-# Pydantic 모델
+# 고정 응답 (모듈 로드 시 한 번만 직렬화)
+# ================================================================================
+
+# 카카오 simpleText 응답 틀 (텍스트 자리만 채워서 사용)
+_SIMPLE_TEXT_PREFIX = b'{"version":"2.0","template":{"outputs":[{"simpleText":{"text":'
+_SIMPLE_TEXT_SUFFIX = b'}}]}}'
+
+def simple_text_bytes(text: str) -> bytes:
+    """카카오 simpleText 응답 JSON 생성 (텍스트만 직렬화)"""
+    return _SIMPLE_TEXT_PREFIX + orjson.dumps(text) + _SIMPLE_TEXT_SUFFIX
+
+def simple_text_response(text: str) -> Response:
+    """카카오 simpleText 응답"""
+    return Response(content=simple_text_bytes(text), media_type="application/json")
+
+_NO_NEWS_BYTES = simple_text_bytes("최신 뉴스를 준비 중입니다. 잠시 후 다시 시도해주세요.")
+
+_ERROR_BYTES = simple_text_bytes("뉴스를 불러오는 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.")
+
+# 카테고리별 "뉴스 없음" 응답
+_EMPTY_BY_CATEGORY = {
+    category: simple_text_bytes(
+        f"{emoji} '{category}' 카테고리의 최신 뉴스가 아직 없습니다.\n\n잠시 후 다시 시도해주시거나, 다른 카테고리를 선택해주세요."
+    )
+    for category, emoji in CATEGORY_EMOJI.items()
+}
+
+# ================================================================================
+# 헬스체크용 현재 시각 (1초마다 백그라운드에서 갱신)
 # ================================================================================
 
-class UserInfo(BaseModel):
-    id: str
-    properties: Optional[Dict[str, Any]] = None
-
-class UserRequest(BaseModel):
-    user: UserInfo
-    utterance: Optional[str] = ""
-    params: Optional[Dict[str, Any]] = {}
-    block: Optional[Dict[str, Any]] = {}
-    lang: Optional[str] = None
-
-class Action(BaseModel):
-    name: Optional[str] = None
-    clientExtra: Optional[Dict[str, Any]] = None
-    params: Optional[Dict[str, Any]] = {}
-    detailParams: Optional[Dict[str, Any]] = {}
-    id: Optional[str] = None
-
-class Bot(BaseModel):
-    id: Optional[str] = None
-    name: Optional[str] = None
-
-class RequestBody(BaseModel):
-    userRequest: UserRequest
-    action: Optional[Action] = None
-    bot: Optional[Bot] = None
-    contexts: Optional[list] = []
+_now_iso = datetime.now().isoformat()
+_ping_bytes = orjson.dumps({"alive": True, "timestamp": _now_iso})
+
+async def _tick_now_iso():
+    """헬스체크 요청마다 datetime을 만들지 않도록 현재 시각 문자열을 1초마다 갱신"""
+    global _now_iso, _ping_bytes
+    while True:
+        await asyncio.sleep(1)
+        _now_iso = datetime.now().isoformat()
+        _ping_bytes = orjson.dumps({"alive": True, "timestamp": _now_iso})
 
 # ================================================================================
 # 카테고리 감지 함수
 # ================================================================================
 
+@functools.lru_cache(maxsize=2048)
 def detect_category(user_message: str) -> Optional[str]:
     """
     사용자 발화에서 카테고리 감지
     
+    같은 발화가 반복되는 경우가 많아 결과를 LRU 캐시에 보관
+    (캐시 적중 시에는 감지 로그가 남지 않음)
+    
     Args:
         user_message: 사용자 발화 내용
         
@@ -130,11 +200,25 @@ def detect_category(user_message: str) -> Optional[str]:
     # 공백 제거 후 소문자 변환
     message = user_message.replace(" ", "").lower()
     
-    # 카테고리 매핑에서 찾기
-    for keyword, category in CATEGORY_MAP.items():
-        if keyword in message:
-            logger.info(f"🎯 카테고리 감지: '{keyword}' → '{category}'")
+    # 발화 자체가 키워드인 경우 (바로가기 버튼 등) 딕셔너리 조회로 끝
+    category = CATEGORY_MAP.get(message)
+    if category:
+        logger.info("🎯 카테고리 감지: '%s' → '%s'", message, category)
+        return category
+    
+    # 카테고리 키워드를 한 번의 스캔으로 찾기 (가장 앞, 그중 가장 긴 키워드)
+    if AHOCORASICK_AVAILABLE:
+        for _, (keyword, category) in _CATEGORY_AUTOMATON.iter_long(message):
+            logger.info("🎯 카테고리 감지: '%s' → '%s'", keyword, category)
             return category
+        return None
+    
+    match = _CATEGORY_PATTERN.search(message)
+    if match:
+        keyword = match.group(0)
+        category = CATEGORY_MAP[keyword]
+        logger.info("🎯 카테고리 감지: '%s' → '%s'", keyword, category)
+        return category
     
     return None
 
@@ -148,7 +232,7 @@ def normalize_category(category: str) -> str:
     normalized = category.strip()
     return normalized
 
-def get_news_by_category(category: str, limit: int = 3) -> list:
+def get_news_by_category(category: str, limit: int = 3) -> Optional[list]:
     """
     특정 카테고리의 최신 뉴스 조회
     
@@ -157,123 +241,136 @@ def get_news_by_category(category: str, limit: int = 3) -> list:
         limit: 조회할 뉴스 개수
         
     Returns:
-        뉴스 리스트
+        뉴스 리스트 (시트를 조회할 수 없으면 None)
     """
     try:
-        # 전체 뉴스 조회 (더 많이 가져오기)
-        all_news = get_latest_news_from_gsheet(limit=200)
-        
-        if not all_news:
-            logger.warning("⚠️ 구글 시트에 뉴스가 없습니다")
-            return []
-        
         # 정규화된 카테고리로 비교
         normalized_target = normalize_category(category)
-        logger.info(f"🔍 찾으려는 카테고리: '{normalized_target}'")
-        
-        # 카테고리 필터링 (대소문자 구분 없이)
-        filtered_news = []
+        logger.info("🔍 찾으려는 카테고리: '%s'", normalized_target)
         
-        # 디버깅: 모든 카테고리 출력
-        all_categories = set()
-        for news in all_news:
-            news_category = normalize_category(news.get('category', ''))
-            all_categories.add(news_category)
-            
-            # 카테고리 비교 (대소문자 구분 없이)
-            if news_category.lower() == normalized_target.lower():
-                filtered_news.append(news)
+        # 캐시 갱신 시 미리 분류해 둔 카테고리별 최신순 목록에서 조회
+        filtered_news = get_records_by_category(normalized_target, limit=limit)
+        if filtered_news is None:
+            return None
         
-        logger.info(f"📊 구글 시트의 모든 카테고리: {all_categories}")
-        logger.info(f"📊 카테고리 '{normalized_target}': {len(filtered_news)}개 (전체 {len(all_news)}개 중)")
+        logger.info("📊 카테고리 '%s': %d개", normalized_target, len(filtered_news))
         
-        # 디버깅: 매칭된 뉴스 로그
-        for idx, news in enumerate(filtered_news[:5]):
-            logger.info(
-                f"   [{idx+1}] {news.get('title', '')[:40]}... "
-                f"(카테고리: '{news.get('category', 'N/A')}')"
+        # 디버깅: 매칭된 뉴스 로그 (DEBUG일 때만 생성)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "   매칭된 뉴스: %s",
+                [news.get('title', '')[:40] for news in filtered_news[:5]]
             )
         
-        # 상위 N개만 반환
-        return filtered_news[:limit]
+        return filtered_news
         
     except Exception as e:
-        logger.error(f"❌ 카테고리별 뉴스 조회 실패: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return []
+        logger.exception("❌ 카테고리별 뉴스 조회 실패: %s", e)
+        return None
 
 # ================================================================================
 # 뉴스봇 핸들러 (공통 로직)
 # ================================================================================
 
-async def handle_news_request(request: RequestBody):
+# 뉴스가 없던 카테고리는 이 시간 동안 조회 없이 바로 "뉴스 없음" 응답
+EMPTY_CATEGORY_TTL = 30
+
+_empty_category_until: Dict[str, float] = {}
+
+# 같은 사용자의 같은 발화(카카오 재시도 등)는 이 시간 동안 같은 응답을 공유
+INFLIGHT_TTL = 5
+
+_inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+async def handle_news_request(body: bytes):
     """
     뉴스봇 요청 처리 (공통 로직)
+    
+    카카오 요청 본문 중 실제로 사용하는 user.id, utterance만 꺼내 쓴다
     """
     logger.info("=" * 50)
     logger.info("📰 News bot request")
     
     try:
         # 사용자 정보
-        user_id = request.userRequest.user.id
-        user_message = request.userRequest.utterance
-        
-        logger.info(f"   User: {user_id}")
-        logger.info(f"   Message: '{user_message}'")
-        
+        data = orjson.loads(body)
+        user_request = data.get('userRequest') or {}
+        user_id = (user_request.get('user') or {}).get('id', '')
+        user_message = user_request.get('utterance') or ''
+        if not isinstance(user_id, str) or not isinstance(user_message, str):
+            raise TypeError(f"user.id/utterance must be strings: {user_id!r}, {user_message!r}")
+    except Exception as e:
+        logger.exception("❌ News bot error: %s", e)
+        return Response(content=_ERROR_BYTES, media_type="application/json")
+    
+    logger.info("   User: %s", user_id)
+    logger.info("   Message: '%s'", user_message)
+    
+    # 동일 요청이 처리 중이거나 방금 끝났으면 그 결과를 함께 사용
+    key = (user_id, user_message)
+    task = _inflight.get(key)
+    if task is None:
+        loop = asyncio.get_running_loop()
+        task = asyncio.create_task(build_news_response(user_message))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: loop.call_later(INFLIGHT_TTL, _inflight.pop, key, None))
+    else:
+        logger.info("   ♻️ 동일 요청 처리 결과 재사용")
+    
+    # 한 요청이 취소돼도 공유 중인 작업은 계속 진행
+    return await asyncio.shield(task)
+
+async def build_news_response(user_message: str) -> Response:
+    """
+    사용자 발화에 맞는 뉴스 응답 생성
+    """
+    try:
         # 카테고리 감지
         category = detect_category(user_message)
+        logger.info("   Category: %s", category)
         
         if category:
+            # 최근에 뉴스가 없던 카테고리면 조회 생략
+            if time.monotonic() < _empty_category_until.get(category, 0):
+                logger.info("   '%s' 카테고리 뉴스 없음 (캐시)", category)
+                return Response(content=_EMPTY_BY_CATEGORY[category], media_type="application/json")
+            
             # 카테고리별 뉴스 조회
-            news_items = get_news_by_category(category, limit=3)
+            news_items = await run_sheets_call(get_news_by_category, category, limit=3)
             category_emoji = CATEGORY_EMOJI.get(category, "📰")
             
             if not news_items:
                 # 카테고리는 감지했지만 해당 뉴스가 없는 경우
-                logger.warning(f"⚠️ '{category}' 카테고리 뉴스 없음")
-                return {
-                    "version": "2.0",
-                    "template": {
-                        "outputs": [
-                            {
-                                "simpleText": {
-                                    "text": f"{category_emoji} '{category}' 카테고리의 최신 뉴스가 아직 없습니다.\n\n잠시 후 다시 시도해주시거나, 다른 카테고리를 선택해주세요."
-                                }
-                            }
-                        ]
-                    }
-                }
+                logger.warning("⚠️ '%s' 카테고리 뉴스 없음", category)
+                # 시트를 정상적으로 읽었는데 비어 있는 경우만 기억 (조회 실패는 제외)
+                if news_items is not None:
+                    _empty_category_until[category] = time.monotonic() + EMPTY_CATEGORY_TTL
+                return Response(content=_EMPTY_BY_CATEGORY[category], media_type="application/json")
             
             title_text = f"{category_emoji} {category} 뉴스 (총 {len(news_items)}건)"
         else:
             # 전체 최신 뉴스 5개 조회
-            news_items = get_latest_news_from_gsheet(limit=5)
+            news_items = await run_sheets_call(get_latest_news_from_gsheet, limit=5)
             title_text = f"📰 오늘의 부동산 뉴스 (총 {len(news_items)}건)"
         
         if not news_items:
             logger.warning("⚠️ 구글 시트에 뉴스 없음")
-            return {
-                "version": "2.0",
-                "template": {
-                    "outputs": [
-                        {"simpleText": {"text": "최신 뉴스를 준비 중입니다. 잠시 후 다시 시도해주세요."}}
-                    ]
-                }
-            }
+            return Response(content=_NO_NEWS_BYTES, media_type="application/json")
         
-        logger.info(f"✅ 구글 시트 조회 완료: {len(news_items)}개")
+        logger.info("✅ 구글 시트 조회 완료: %d개", len(news_items))
         
-        # 로깅
-        for idx, item in enumerate(news_items, 1):
-            logger.info(
-                f"   [{idx}] {item.get('title', '')[:40]}... "
-                f"(카테고리: {item.get('category', 'N/A')}, 점수: {item.get('relevance_score', 0)})"
+        # 로깅 (DEBUG일 때만 생성)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "   뉴스 목록: %s",
+                [
+                    (item.get('title', '')[:40], item.get('category', 'N/A'), item.get('relevance_score', 0))
+                    for item in news_items
+                ]
             )
         
         # 뉴스 리스트 텍스트 생성
-        news_list = f"{title_text}\n\n"
+        parts = [title_text]
         
         for idx, item in enumerate(news_items, 1):
             title = item.get('title', '제목 없음')
@@ -281,61 +378,41 @@ async def handle_news_request(request: RequestBody):
             url = item.get('url') or item.get('link') or item.get('originallink', '')
             
             if not url:
-                logger.warning(f"   ⚠️ 뉴스 {idx} URL 없음")
+                logger.warning("   ⚠️ 뉴스 %d URL 없음", idx)
                 url = "(URL 정보 없음)"
-            else:
-                logger.info(f"   뉴스 {idx}: URL = {url[:50]}")
             
-            news_list += f"{idx}. {title}\n{url}\n\n"
+            parts.append(f"{idx}. {title}\n{url}")
+        
+        news_list = "\n\n".join(parts)
         
-        logger.info(f"✅ 응답 완료")
+        logger.info("✅ 응답 완료")
         
         # 카카오톡 응답
-        return {
-            "version": "2.0",
-            "template": {
-                "outputs": [
-                    {
-                        "simpleText": {
-                            "text": news_list.strip()
-                        }
-                    }
-                ]
-            }
-        }
+        return simple_text_response(news_list)
         
     except Exception as e:
-        logger.error(f"❌ News bot error: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
-        return {
-            "version": "2.0",
-            "template": {
-                "outputs": [
-                    {"simpleText": {"text": "뉴스를 불러오는 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."}}
-                ]
-            }
-        }
+        logger.exception("❌ News bot error: %s", e)
+        return Response(content=_ERROR_BYTES, media_type="application/json")
 
 # ================================================================================
 # API 엔드포인트
 # ================================================================================
 
 @app.post("/news")
-async def news_bot(request: RequestBody):
+async def news_bot(request: Request):
     """
     부동산 뉴스봇 - 카테고리별 뉴스 3개 제공 (/news)
     """
     logger.info("🚨 /news 엔드포인트 호출됨!")
-    return await handle_news_request(request)
+    return await handle_news_request(await request.body())
 
 @app.post("/new")
-async def news_bot_legacy(request: RequestBody):
+async def news_bot_legacy(request: Request):
     """
     부동산 뉴스봇 - 카테고리별 뉴스 3개 제공 (/new - 하위 호환)
     """
     logger.warning("🚨 /new 엔드포인트 호출됨! (deprecated, /news 사용 권장)")
-    return await handle_news_request(request)
+    return await handle_news_request(await request.body())
 
 # ================================================================================
 # 디버깅 엔드포인트 추가
@@ -347,7 +424,7 @@ async def debug_categories():
     현재 구글 시트의 모든 카테고리 조회 (디버깅용)
     """
     try:
-        all_news = get_latest_news_from_gsheet(limit=200)
+        all_news = await run_sheets_call(get_latest_news_from_gsheet, limit=200)
         
         if not all_news:
             return {
@@ -405,16 +482,31 @@ async def health_check():
         "status": "healthy",
         "service": "오백냥 부동산 뉴스봇",
         "version": "2.0.2",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso,
+        "detect_category_cache": detect_category.cache_info()._asdict()
     }
 
-@app.get("/health/ping")
-async def health_ping():
-    """Simple ping endpoint"""
-    return {
-        "alive": True,
-        "timestamp": datetime.now().isoformat()
-    }
+class HealthPing:
+    """
+    Simple ping endpoint (/health/ping)
+    
+    로드밸런서/업타임 체크가 자주 호출하므로 FastAPI 요청 처리를 거치지 않는
+    raw ASGI 앱으로 미리 직렬화된 응답을 그대로 보낸다
+    """
+    
+    async def __call__(self, scope, receive, send):
+        body = _ping_bytes
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+app.router.routes.append(Route("/health/ping", endpoint=HealthPing(), methods=["GET", "HEAD"]))
 
 @app.get("/")
 async def root():
@@ -435,34 +527,85 @@ async def root():
 # Startup & Shutdown
 # ================================================================================
 
+# 뉴스 캐시 백그라운드 갱신 주기 (캐시 TTL보다 짧게)
+CACHE_REFRESH_INTERVAL = 25
+
+_cache_refresh_task: Optional[asyncio.Task] = None
+_clock_task: Optional[asyncio.Task] = None
+
+async def _refresh_news_cache_periodically():
+    """요청 경로에서 시트 조회가 일어나지 않도록 주기적으로 캐시 갱신"""
+    while True:
+        await asyncio.sleep(CACHE_REFRESH_INTERVAL)
+        if await run_sheets_call(refresh_news_cache):
+            # 새로 읽은 시트 기준으로 다시 판단하도록 "뉴스 없음" 기록 초기화
+            _empty_category_until.clear()
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize resources on startup"""
+    global _cache_refresh_task, _clock_task
+    
     logger.info("=" * 70)
     logger.info("🚀 Starting 오백냥 뉴스봇 서버 (카테고리별)...")
     logger.info("=" * 70)
     
-    # CSV/Sheets 초기화
-    csv_success = init_csv_file()
-    gsheet_success = init_google_sheets()
+    _clock_task = asyncio.create_task(_tick_now_iso())
+    start_sheets_executor()
+    
+    # CSV/Sheets 초기화 (블로킹 I/O라 스레드에서 동시에 실행)
+    csv_success, gsheet_success = await asyncio.gather(
+        asyncio.to_thread(init_csv_file),
+        asyncio.to_thread(init_google_sheets)
+    )
     
     if csv_success:
         logger.info("✅ CSV logging enabled")
     if gsheet_success:
         logger.info("✅ Google Sheets logging enabled")
+        
+        # 뉴스 캐시 워밍업 + 백그라운드 갱신 시작
+        await run_sheets_call(refresh_news_cache)
+        _cache_refresh_task = asyncio.create_task(_refresh_news_cache_periodically())
     
     logger.info("=" * 70)
     logger.info("✅ 오백냥 뉴스봇 서버 시작 완료!")
     logger.info("   - 서비스: 카테고리별 부동산 뉴스 제공")
     logger.info("   - 엔드포인트: /news (권장), /new (하위 호환)")
     logger.info("   - 디버깅: /debug/categories, /debug/test")
-    logger.info("   - 카테고리:")
-    for cat in CATEGORY_EMOJI.keys():
-        logger.info(f"      • {cat}")
+    logger.info("   - 카테고리: %s", ", ".join(CATEGORY_EMOJI))
     logger.info("=" * 70)
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup resources"""
     logger.info("👋 Shutting down 오백냥 뉴스봇...")
+    
+    if _cache_refresh_task:
+        _cache_refresh_task.cancel()
+    if _clock_task:
+        _clock_task.cancel()
+    shutdown_sheets_executor()
+    _inflight.clear()
+    
     logger.info("✅ Shutdown complete")
+
+# ================================================================================
+# 로컬 실행
+# ================================================================================
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    # 워커 프로세스가 같은 값을 보고 시트 호출 한도를 나눠 갖도록 환경변수로 고정
+    os.environ.setdefault("WEB_CONCURRENCY", "4")
+    
+    # 워커마다 캐시/시트 클라이언트를 따로 가지며, startup_event에서 각자 워밍업
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ["WEB_CONCURRENCY"])
+    )